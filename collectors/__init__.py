@@ -1,7 +1,24 @@
 from .base import BaseCollector
-from .http_collector import HttpCollector
-from .redis_collector import RedisCollector
-from .postgres_collector import PostgresCollector
+
+# Backends are imported on first access so a config that only uses one
+# server type never loads the other drivers (httpx, redis, asyncpg).
+_BACKENDS = {
+    "HttpCollector": ".http_collector",
+    "RedisCollector": ".redis_collector",
+    "PostgresCollector": ".postgres_collector",
+}
+
+
+def __getattr__(name: str):
+    module = _BACKENDS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseCollector",
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 
 
@@ -23,8 +25,61 @@ class BaseCollector(ABC):
         self.name = name
         self.poll_every = poll_every
         self.url = url
+        # Recent failure results by message, reused while a server stays down
+        self._errors: dict[str, dict] = {}
+        # Last result and when it finished: (monotonic_time, result)
+        self._last: tuple[float, dict] | None = None
+        self._last_lock = asyncio.Lock()
 
     @abstractmethod
     async def collect(self) -> dict:
         """Fetch current metrics. Must not raise — return error key on failure."""
         ...
+
+    @property
+    def deadline(self) -> float:
+        """Upper bound in seconds on a single ``collect()``.
+
+        Kept under ``poll_every`` so one stalled server can't hold its poll
+        loop (and the shared event loop) past the next scheduled poll.
+        """
+        return self.poll_every * 0.9
+
+    async def get_cached(self, max_age: float | None = None) -> dict:
+        """Return the last result if fresh enough, otherwise ``collect()``.
+
+        ``max_age`` defaults to ``poll_every``. Concurrent callers share a
+        single in-flight fetch: anyone who waited on it gets its result
+        instead of triggering another round-trip, even with ``max_age=0``.
+        """
+        ttl = self.poll_every if max_age is None else max_age
+        requested = time.monotonic()
+        async with self._last_lock:
+            if self._last is not None:
+                fetched_at, result = self._last
+                if fetched_at >= requested or requested - fetched_at < ttl:
+                    return result
+            result = await self.collect()
+            self._last = (time.monotonic(), result)
+            return result
+
+    def _error(self, message: str) -> dict:
+        """Return the failure result for ``message``, reusing a recent one.
+
+        Results are treated as read-only by every consumer, so a server
+        that keeps failing the same way doesn't allocate a new dict per poll.
+        """
+        result = self._errors.get(message)
+        if result is None:
+            if len(self._errors) >= 4:
+                del self._errors[next(iter(self._errors))]
+            result = self._errors[message] = {"metrics": [], "error": message}
+        return result
+
+    def _timed_out(self) -> dict:
+        """Failure result for a collect that overran ``deadline``."""
+        return self._error(f"Timed out after {self.deadline:g}s")
+
+    async def aclose(self) -> None:
+        """Release long-lived connections. Called once on shutdown."""
+        return None
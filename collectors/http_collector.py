@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
+import orjson
 
 from .base import BaseCollector
 
@@ -11,19 +14,43 @@ class HttpCollector(BaseCollector):
     def __init__(self, name: str, metrics_endpoint: str, poll_every: int = 5) -> None:
         super().__init__(name, poll_every, url=metrics_endpoint)
         self.metrics_endpoint = metrics_endpoint
+        # Shared across polls so keep-alive connections survive between collects
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Keep the idle socket well past poll_every so every poll reuses it;
+            # the server's own keep-alive timeout still wins if shorter
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(5.0, connect=3.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=1,
+                    max_connections=2,
+                    keepalive_expiry=300.0,
+                ),
+                http2=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
 
     async def collect(self) -> dict:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(self.metrics_endpoint)
+            async with asyncio.timeout(self.deadline):
+                resp = await self._get_client().get(self.metrics_endpoint)
                 resp.raise_for_status()
-                data = resp.json()
+                data = orjson.loads(resp.content)
 
             # Normalize: ensure metrics key exists
             metrics = data.get("metrics", [])
             return {"metrics": metrics}
 
+        except TimeoutError:
+            return self._timed_out()
         except httpx.ConnectError:
-            return {"metrics": [], "error": "Connection refused"}
+            return self._error("Connection refused")
         except Exception as e:
-            return {"metrics": [], "error": str(e)}
+            return self._error(str(e))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
 
@@ -10,7 +11,7 @@ import asyncpg
 from .base import BaseCollector
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomQuery:
     label: str
     sql: str
@@ -20,6 +21,39 @@ class CustomQuery:
     poll_every: int = 15
 
 
+# One round-trip for every system metric
+_SYSTEM_STATS_SQL = """SELECT
+    pg_database_size(current_database()) AS db_size,
+    numbackends,
+    xact_commit,
+    xact_rollback,
+    blks_read,
+    blks_hit,
+    deadlocks,
+    temp_files
+FROM pg_stat_database
+WHERE datname = current_database()"""
+
+
+# Failures that mean the server is unreachable rather than a query being
+# wrong; any of these fails the whole collect instead of one metric.
+# TimeoutError is an OSError too, but a slow query (command_timeout) only
+# fails that query, so _collect checks it before this tuple
+_CONNECT_ERRORS = (
+    OSError,
+    asyncpg.InterfaceError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.CannotConnectNowError,
+)
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode numeric as float so query values skip Decimal construction."""
+    await conn.set_type_codec(
+        "numeric", encoder=str, decoder=float, schema="pg_catalog", format="text"
+    )
+
+
 class PostgresCollector(BaseCollector):
     def __init__(
         self,
@@ -28,138 +62,192 @@ class PostgresCollector(BaseCollector):
         poll_every: int = 15,
         system_stats: bool = True,
         queries: list[CustomQuery] | None = None,
+        pool_min_size: int = 1,
+        pool_max_size: int = 4,
     ) -> None:
         super().__init__(name, poll_every, url=dsn)
         self.dsn = dsn
         self.system_stats = system_stats
         self.queries = queries or []
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        # Static metric fields per query, built once: {label: metric_dict}
+        self._templates: dict[str, dict] = {q.label: _query_template(q) for q in self.queries}
         # Per-query result cache: {label: (last_run_time, metric_dict)}
         self._query_cache: dict[str, tuple[float, dict]] = {}
+        # Long-lived pool, created on first collect and reused across polls
+        self._pool: asyncpg.Pool | None = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        self.dsn,
+                        min_size=self.pool_min_size,
+                        max_size=self.pool_max_size,
+                        timeout=5,
+                        command_timeout=5,
+                        # Keep prepared statements for the pool's lifetime so
+                        # recurring queries skip parse/plan on every poll
+                        statement_cache_size=1024,
+                        max_cached_statement_lifetime=0,
+                        init=_init_connection,
+                    )
+        return self._pool
+
+    async def aclose(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
 
     async def collect(self) -> dict:
         try:
-            conn = await asyncpg.connect(self.dsn, timeout=5)
-        except Exception as e:
-            return {"metrics": [], "error": f"Connect failed: {e}"}
+            async with asyncio.timeout(self.deadline):
+                return await self._collect()
+        except TimeoutError:
+            return self._timed_out()
 
+    async def _collect(self) -> dict:
         try:
-            metrics: list[dict] = []
-
-            # -- System stats (pg_stat_*) --
-            if self.system_stats:
-                # Database size first
-                db_size = await conn.fetchval(
-                    "SELECT pg_database_size(current_database())"
-                )
-                if db_size:
-                    metrics.append({
-                        "key": "db_size_mb",
-                        "label": "Database Size",
-                        "value": round(db_size / 1_048_576, 1),
-                        "unit": "MB",
-                    })
-
-                db_stats = await conn.fetchrow(
-                    """SELECT
-                        numbackends,
-                        xact_commit,
-                        xact_rollback,
-                        blks_read,
-                        blks_hit,
-                        deadlocks,
-                        temp_files
-                    FROM pg_stat_database
-                    WHERE datname = current_database()"""
-                )
-                if db_stats:
-                    metrics.append({
-                        "key": "active_connections",
-                        "label": "Active Connections",
-                        "value": db_stats["numbackends"],
-                        "unit": "conns",
-                        "warn_above": 50,
-                    })
-                    metrics.append({
-                        "key": "txn_committed",
-                        "label": "Txn Committed",
-                        "value": db_stats["xact_commit"],
-                        "unit": "count",
-                    })
-                    metrics.append({
-                        "key": "txn_rolled_back",
-                        "label": "Txn Rolled Back",
-                        "value": db_stats["xact_rollback"],
-                        "unit": "count",
-                        "warn_above": 100,
-                    })
-
-                    blks_hit = db_stats["blks_hit"]
-                    blks_read = db_stats["blks_read"]
-                    total = blks_hit + blks_read
-                    if total > 0:
-                        metrics.append({
-                            "key": "cache_hit_rate",
-                            "label": "Cache Hit Rate",
-                            "value": round(blks_hit / total * 100, 2),
-                            "unit": "%",
-                            "warn_below": 99,
-                        })
-
-                    metrics.append({
-                        "key": "deadlocks",
-                        "label": "Deadlocks",
-                        "value": db_stats["deadlocks"],
-                        "unit": "count",
-                        "warn_above": 0,
-                    })
-                    metrics.append({
-                        "key": "temp_files",
-                        "label": "Temp Files",
-                        "value": db_stats["temp_files"],
-                        "unit": "count",
-                        "warn_above": 100,
-                    })
-
-            # -- Custom YAML queries (with per-query poll_every) --
-            now = time.monotonic()
-            for q in self.queries:
-                cache_entry = self._query_cache.get(q.label)
-                if cache_entry and (now - cache_entry[0]) < q.poll_every:
-                    # Use cached result
-                    metrics.append(cache_entry[1])
-                    continue
-
-                try:
-                    row = await conn.fetchrow(q.sql)
-                    if row:
-                        val = row[0]
-                        metric = {
-                            "key": q.label.lower().replace(" ", "_").replace("(", "").replace(")", ""),
-                            "label": q.label,
-                            "value": val,
-                            "unit": "count",
-                        }
-                        if q.color:
-                            metric["color"] = q.color
-                        if q.warn_above is not None:
-                            metric["warn_above"] = q.warn_above
-                        if q.warn_below is not None:
-                            metric["warn_below"] = q.warn_below
-                        self._query_cache[q.label] = (now, metric)
-                        metrics.append(metric)
-                except Exception as e:
-                    metrics.append({
-                        "key": f"query_error",
-                        "label": f"{q.label} (error)",
-                        "value": str(e),
-                    })
-
-            await conn.close()
-            return {"metrics": metrics}
-
+            pool = await self._get_pool()
         except Exception as e:
-            try:
-                await conn.close()
-            except Exception:
-                pass
-            return {"metrics": [], "error": str(e)}
+            return self._error(f"Connect failed: {e}")
+
+        # Queries whose per-query poll_every has elapsed (or never ran)
+        now = time.monotonic()
+        due = [
+            q for q in self.queries
+            if (entry := self._query_cache.get(q.label)) is None
+            or (now - entry[0]) >= q.poll_every
+        ]
+
+        # Each coroutine acquires its own pooled connection, so the
+        # round-trips overlap instead of running back to back.
+        jobs = [self._run_query(pool, q) for q in due]
+        if self.system_stats:
+            jobs.append(self._system_stats(pool))
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, _CONNECT_ERRORS) and not isinstance(result, TimeoutError):
+                return self._error(f"Connect failed: {result}")
+
+        metrics: list[dict] = []
+        if self.system_stats:
+            stats = results.pop()
+            if isinstance(stats, BaseException):
+                return self._error(str(stats) or type(stats).__name__)
+            metrics.extend(stats)
+
+        # -- Custom YAML queries (with per-query poll_every) --
+        fresh = dict(zip((q.label for q in due), results))
+        for q in self.queries:
+            if q.label not in fresh:
+                # Use cached result
+                metrics.append(self._query_cache[q.label][1])
+                continue
+
+            result = fresh[q.label]
+            if isinstance(result, BaseException):
+                metrics.append({
+                    "key": f"query_error",
+                    "label": f"{q.label} (error)",
+                    "value": str(result) or type(result).__name__,
+                })
+            elif result is not None:
+                self._query_cache[q.label] = (now, result)
+                metrics.append(result)
+
+        return {"metrics": metrics}
+
+    async def _system_stats(self, pool: asyncpg.Pool) -> list[dict]:
+        metrics: list[dict] = []
+
+        async with pool.acquire() as conn:
+            db_stats = await conn.fetchrow(_SYSTEM_STATS_SQL)
+
+        if db_stats:
+            # Database size first
+            db_size = db_stats["db_size"]
+            if db_size:
+                metrics.append({
+                    "key": "db_size_mb",
+                    "label": "Database Size",
+                    "value": round(db_size / 1_048_576, 1),
+                    "unit": "MB",
+                })
+
+            metrics.append({
+                "key": "active_connections",
+                "label": "Active Connections",
+                "value": db_stats["numbackends"],
+                "unit": "conns",
+                "warn_above": 50,
+            })
+            metrics.append({
+                "key": "txn_committed",
+                "label": "Txn Committed",
+                "value": db_stats["xact_commit"],
+                "unit": "count",
+            })
+            metrics.append({
+                "key": "txn_rolled_back",
+                "label": "Txn Rolled Back",
+                "value": db_stats["xact_rollback"],
+                "unit": "count",
+                "warn_above": 100,
+            })
+
+            blks_hit = db_stats["blks_hit"]
+            blks_read = db_stats["blks_read"]
+            total = blks_hit + blks_read
+            if total > 0:
+                metrics.append({
+                    "key": "cache_hit_rate",
+                    "label": "Cache Hit Rate",
+                    "value": round(blks_hit / total * 100, 2),
+                    "unit": "%",
+                    "warn_below": 99,
+                })
+
+            metrics.append({
+                "key": "deadlocks",
+                "label": "Deadlocks",
+                "value": db_stats["deadlocks"],
+                "unit": "count",
+                "warn_above": 0,
+            })
+            metrics.append({
+                "key": "temp_files",
+                "label": "Temp Files",
+                "value": db_stats["temp_files"],
+                "unit": "count",
+                "warn_above": 100,
+            })
+
+        return metrics
+
+    async def _run_query(self, pool: asyncpg.Pool, q: CustomQuery) -> dict | None:
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(q.sql)
+        if not row:
+            return None
+        return {**self._templates[q.label], "value": row[0]}
+
+
+def _query_template(q: CustomQuery) -> dict:
+    """Build the static part of a custom query's metric; only value changes."""
+    metric = {
+        "key": q.label.lower().replace(" ", "_").replace("(", "").replace(")", ""),
+        "label": q.label,
+        "value": None,
+        "unit": "count",
+    }
+    if q.color:
+        metric["color"] = q.color
+    if q.warn_above is not None:
+        metric["warn_above"] = q.warn_above
+    if q.warn_below is not None:
+        metric["warn_below"] = q.warn_below
+    return metric
@@ -2,10 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import redis.asyncio as aioredis
 
 from .base import BaseCollector
 
+# INFO sections holding every field the collector reports
+_INFO_SECTIONS = ("clients", "memory", "stats", "replication")
+
+# Numeric INFO fields we read; everything else in the reply is skipped
+_INT_FIELDS = frozenset({
+    b"connected_clients",
+    b"used_memory",
+    b"instantaneous_ops_per_sec",
+    b"keyspace_hits",
+    b"keyspace_misses",
+})
+
+
+# Static metric fields, built once: (template, INFO field, value transform)
+_METRIC_SPECS = (
+    (
+        {"key": "connected_clients", "label": "Clients", "value": 0, "unit": "clients", "warn_above": 100},
+        "connected_clients",
+        int,
+    ),
+    (
+        {"key": "used_memory_mb", "label": "Memory", "value": 0, "unit": "MB", "warn_above": 512},
+        "used_memory",
+        lambda b: round(b / 1_048_576, 1),
+    ),
+    (
+        {"key": "ops_per_sec", "label": "Ops/sec", "value": 0, "unit": "ops/s"},
+        "instantaneous_ops_per_sec",
+        int,
+    ),
+)
+_HIT_RATE_TEMPLATE = {"key": "hit_rate", "label": "Hit Rate", "value": 0, "unit": "%", "warn_below": 90}
+_ROLE_TEMPLATE = {"key": "role", "label": "Role", "value": ""}
+
+
+def _raw_reply(response, **options):
+    """Response callback that hands back the undecoded INFO bytes."""
+    return response
+
+
+def _parse_info(raw: bytes, info: dict) -> None:
+    """Copy the fields we use from a raw INFO reply into ``info``."""
+    for line in raw.splitlines():
+        if not line or line.startswith(b"#"):
+            continue
+        key, _, value = line.partition(b":")
+        if key in _INT_FIELDS:
+            info[key.decode()] = int(value)
+        elif key == b"role":
+            info["role"] = value.decode()
+
 
 class RedisCollector(BaseCollector):
     def __init__(self, name: str, host: str = "localhost", port: int = 6379, url: str | None = None, poll_every: int = 10) -> None:
@@ -14,17 +67,39 @@ class RedisCollector(BaseCollector):
         self.redis_url = url
         self.host = host
         self.port = port
+        # Long-lived client; its pool keeps the connection open between polls
+        if url:
+            self._client = aioredis.from_url(
+                url, decode_responses=False, max_connections=2,
+                socket_timeout=5, health_check_interval=30,
+            )
+        else:
+            self._client = aioredis.Redis(
+                host=host, port=port, decode_responses=False, max_connections=2,
+                socket_timeout=3, health_check_interval=30,
+            )
+        # Skip redis-py's full INFO dict builder; _parse_info reads the bytes
+        self._client.set_response_callback("INFO", _raw_reply)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     async def collect(self) -> dict:
         try:
-            if self.redis_url:
-                r = aioredis.from_url(self.redis_url, decode_responses=True, socket_timeout=5)
-            else:
-                r = aioredis.Redis(host=self.host, port=self.port, decode_responses=True, socket_timeout=3)
-            info = await r.info()
-            await r.aclose()
+            # One INFO per section, pipelined into a single round-trip
+            # (multi-section INFO needs Redis 7+)
+            async with asyncio.timeout(self.deadline):
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for section in _INFO_SECTIONS:
+                        pipe.info(section)
+                    replies = await pipe.execute()
+            info: dict = {}
+            for reply in replies:
+                _parse_info(reply, info)
+        except TimeoutError:
+            return self._timed_out()
         except Exception as e:
-            return {"metrics": [], "error": str(e)}
+            return self._error(str(e))
 
         # Compute hit rate
         hits = info.get("keyspace_hits", 0)
@@ -33,41 +108,11 @@ class RedisCollector(BaseCollector):
         hit_rate = round(hits / total * 100, 1) if total > 0 else None
 
         metrics = [
-            {
-                "key": "connected_clients",
-                "label": "Clients",
-                "value": info.get("connected_clients", 0),
-                "unit": "clients",
-                "warn_above": 100,
-            },
-            {
-                "key": "used_memory_mb",
-                "label": "Memory",
-                "value": round(info.get("used_memory", 0) / 1_048_576, 1),
-                "unit": "MB",
-                "warn_above": 512,
-            },
-            {
-                "key": "ops_per_sec",
-                "label": "Ops/sec",
-                "value": info.get("instantaneous_ops_per_sec", 0),
-                "unit": "ops/s",
-            },
+            {**template, "value": scale(info.get(field, 0))}
+            for template, field, scale in _METRIC_SPECS
         ]
-
         if hit_rate is not None:
-            metrics.append({
-                "key": "hit_rate",
-                "label": "Hit Rate",
-                "value": hit_rate,
-                "unit": "%",
-                "warn_below": 90,
-            })
-
-        metrics.append({
-            "key": "role",
-            "label": "Role",
-            "value": info.get("role", "unknown"),
-        })
+            metrics.append({**_HIT_RATE_TEMPLATE, "value": hit_rate})
+        metrics.append({**_ROLE_TEMPLATE, "value": info.get("role", "unknown")})
 
         return {"metrics": metrics}
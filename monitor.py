@@ -9,29 +9,80 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import os
+import stat
 import sys
 from pathlib import Path
 
+import orjson
 import yaml
 
-from collectors import HttpCollector, RedisCollector, PostgresCollector
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 from collectors.base import BaseCollector
-from collectors.postgres_collector import CustomQuery
 from ui.app import DashboardApp
 
 
+@functools.cache
+def _load_yaml(path: str, mtime: float) -> dict:
+    """Parse a YAML file once per (path, mtime); the result is read-only.
+
+    The parsed config is also written to a ``<name>.cache.json`` sidecar
+    stamped with the YAML's mtime, so later runs skip PyYAML entirely.
+    """
+    cache = path + ".cache.json"
+    try:
+        with open(cache, "rb") as f:
+            cached = orjson.loads(f.read())
+        if cached.get("mtime") == mtime:
+            return cached["config"]
+    except (OSError, orjson.JSONDecodeError, AttributeError, KeyError):
+        pass
+
+    with open(path, "rb") as f:
+        config = yaml.load(f, Loader=_Loader)
+
+    # Best effort: a read-only config dir or non-JSON YAML just skips the cache.
+    # The sidecar holds the same DSNs as the YAML, so it gets the YAML's mode,
+    # and is swapped in atomically so a concurrent reader never sees half of it
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                     stat.S_IMODE(os.stat(path).st_mode))
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps({"mtime": mtime, "config": config}))
+        os.replace(tmp, cache)
+    except (OSError, TypeError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return config
+
+
 def load_config(path: Path) -> list[BaseCollector]:
     """Parse servers.yaml and return a list of collectors."""
-    with open(path) as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(str(path), os.path.getmtime(path))
 
     collectors: list[BaseCollector] = []
     for srv in config.get("servers", []):
+        g = srv.get  # bound once; several lookups per server
         name = srv["name"]
-        stype = srv.get("type", "http")
-        poll = srv.get("poll_every", 5)
+        stype = g("type", "http")
+        poll = g("poll_every", 5)
 
         if stype == "http":
+            from collectors import HttpCollector
+
             collectors.append(
                 HttpCollector(
                     name=name,
@@ -41,17 +92,22 @@ def load_config(path: Path) -> list[BaseCollector]:
             )
 
         elif stype == "redis":
+            from collectors import RedisCollector
+
             collectors.append(
                 RedisCollector(
                     name=name,
-                    host=srv.get("host", "localhost"),
-                    port=srv.get("port", 6379),
-                    url=srv.get("url"),
+                    host=g("host", "localhost"),
+                    port=g("port", 6379),
+                    url=g("url"),
                     poll_every=poll,
                 )
             )
 
         elif stype == "postgres":
+            from collectors import PostgresCollector
+            from collectors.postgres_collector import CustomQuery
+
             queries = [
                 CustomQuery(
                     label=q["label"],
@@ -61,15 +117,25 @@ def load_config(path: Path) -> list[BaseCollector]:
                     warn_below=q.get("warn_below"),
                     poll_every=q.get("poll_every", poll),
                 )
-                for q in srv.get("queries", [])
+                for q in g("queries", [])
             ]
+            pool_min = g("pool_min_size", 1)
+            pool_max = g("pool_max_size", 4)
+            if pool_min > pool_max:
+                print(
+                    f"Warning: pool_min_size {pool_min} exceeds pool_max_size {pool_max} "
+                    f"for '{name}', using {pool_max}"
+                )
+                pool_min = pool_max
             collectors.append(
                 PostgresCollector(
                     name=name,
                     dsn=srv["dsn"],
                     poll_every=poll,
-                    system_stats=srv.get("system_stats", True),
+                    system_stats=g("system_stats", True),
                     queries=queries,
+                    pool_min_size=pool_min,
+                    pool_max_size=pool_max,
                 )
             )
         else:
@@ -98,7 +164,7 @@ def main() -> None:
         sys.exit(1)
 
     app = DashboardApp(collectors)
-    app.run()
+    app.run(loop=uvloop.new_event_loop() if uvloop else None)
 
 
 if __name__ == "__main__":
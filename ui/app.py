@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import re
 
 from textual.app import App, ComposeResult
@@ -13,25 +14,27 @@ from textual.widgets import Header, Footer, Static
 from collectors.base import BaseCollector
 from ui.widgets.server_card import ServerCard
 
+# Characters not allowed in a card's widget id
+_UNSAFE_ID_CHARS = re.compile(r"[^a-z0-9_-]")
+
 
 class StatusBar(Static):
     """Colored status bar showing aggregate server health."""
 
+    # Reactives repaint on change by themselves, and Textual merges the
+    # two assignments in _update_status_bar into a single refresh
     status: reactive[str] = reactive("waiting")
     detail: reactive[str] = reactive("")
 
+    _OK_PREFIX = "[bold white on green] All Systems OK [/]  [green]"
+    _WAITING = "[dim]Waiting for server data...[/]"
+
     def render(self) -> str:
         if self.status == "ok":
-            return f"[bold white on green] All Systems OK [/]  [green]{self.detail}[/]"
+            return f"{self._OK_PREFIX}{self.detail}[/]"
         elif self.status == "error":
             return f"[bold white on red] {self.detail} [/]"
-        return "[dim]Waiting for server data...[/]"
-
-    def watch_status(self, new_val: str) -> None:
-        self.refresh()
-
-    def watch_detail(self, new_val: str) -> None:
-        self.refresh()
+        return self._WAITING
 
 
 class DashboardApp(App):
@@ -78,8 +81,17 @@ class DashboardApp(App):
         super().__init__()
         self.collectors = collectors
         self._cards: dict[str, ServerCard] = {}
-        self._tasks: list[asyncio.Task] = []
+        # Poll schedule as a heap of (due time, index, collector), drained by
+        # a loop timer re-armed for the next deadline
+        self._schedule: list[tuple[float, int, BaseCollector]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task] = set()
+        # Latest result per server, applied to the cards once per frame
+        self._pending: dict[str, dict] = {}
         self._status_bar: StatusBar | None = None
+        # Servers that have reported at least once, and those currently failing
+        self._reported: set[str] = set()
+        self._failing: set[str] = set()
         self._mini_mode: bool = False
 
     def compose(self) -> ComposeResult:
@@ -88,50 +100,98 @@ class DashboardApp(App):
         yield self._status_bar
         with Grid(id="dashboard-grid"):
             for c in self.collectors:
-                safe_id = re.sub(r'[^a-z0-9_-]', '', c.name.lower().replace(' ', '-'))
+                safe_id = _UNSAFE_ID_CHARS.sub("", c.name.lower().replace(" ", "-"))
                 card = ServerCard(c.name, url=c.url, id=f"card-{safe_id}")
                 self._cards[c.name] = card
                 yield card
         yield Footer()
 
     def on_mount(self) -> None:
-        for collector in self.collectors:
-            task = asyncio.create_task(self._poll_loop(collector))
-            self._tasks.append(task)
+        start = asyncio.get_running_loop().time()
+        self._schedule = [(start, i, c) for i, c in enumerate(self.collectors)]
+        self._pump()
+
+    def _flush_pending(self) -> None:
+        """Apply buffered results to their cards and the status bar.
+
+        Runs inside ``batch_update()`` so every card touched here lands in
+        one compositor frame, which Textual wraps in a synchronized-output
+        sequence on terminals that support it.
+        """
+        if not self._pending:
+            return
+        with self.batch_update():
+            while self._pending:
+                name, result = self._pending.popitem()
+                self._cards[name].result = result
+                self._update_status_bar(name, result)
+
+    def _update_status_bar(self, name: str, result: dict) -> None:
+        """Fold one server's result into the running health tallies.
+
+        Only an ok/error transition (or a server's first report) touches
+        the status bar; the steady state is two set lookups.
+        """
+        failed = bool(result.get("error"))
+        if name in self._reported and (name in self._failing) == failed:
+            return
+        self._reported.add(name)
+        if failed:
+            self._failing.add(name)
+        else:
+            self._failing.discard(name)
 
-    def _update_status_bar(self) -> None:
-        """Recompute aggregate status from all cards."""
         if self._status_bar is None:
             return
-        error_names: list[str] = []
-        total = 0
-        for name, card in self._cards.items():
-            r = card.result
-            if r is None:
-                continue
-            total += 1
-            if r.get("error"):
-                error_names.append(name)
-
-        if total == 0:
-            self._status_bar.status = "waiting"
-            self._status_bar.detail = ""
-        elif error_names:
+        total = len(self._reported)
+        if self._failing:
+            error_names = [n for n in self._cards if n in self._failing]
             count = len(error_names)
             label = f"{count} Server{'s' if count > 1 else ''} Down"
-            self._status_bar.status = "error"
-            self._status_bar.detail = f"{label} \u2014 {', '.join(error_names)}"
+            status, detail = "error", f"{label} \u2014 {', '.join(error_names)}"
         else:
-            self._status_bar.status = "ok"
-            self._status_bar.detail = f"{total}/{total} servers healthy"
-
-    async def _poll_loop(self, collector: BaseCollector) -> None:
-        card = self._cards[collector.name]
-        while True:
-            result = await collector.collect()
-            card.result = result
-            self._update_status_bar()
-            await asyncio.sleep(collector.poll_every)
+            status, detail = "ok", f"{total}/{total} servers healthy"
+        self._status_bar.status = status
+        self._status_bar.detail = detail
+
+    def _pump(self) -> None:
+        """Start every collector that is due, then arm a timer for the next.
+
+        A single loop timer drives all collectors, so idle time costs no
+        parked coroutine or sleep future. Each wake-up spawns one Task, plus
+        a TaskGroup child per collector when several come due together.
+        """
+        heap = self._schedule
+        if not heap:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        due: list[tuple[float, int, BaseCollector]] = []
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap))
+        if len(due) == 1:
+            # The common case, since intervals rarely line up: one Task
+            self._spawn(self._poll_once(due[0][2]))
+        elif due:
+            self._spawn(self._poll_batch([c for _, _, c in due]))
+        for deadline, i, c in due:
+            # Fixed cadence; resync instead of bursting if we fell behind
+            next_due = deadline + c.poll_every
+            if next_due <= now:
+                next_due = now + c.poll_every
+            heapq.heappush(heap, (next_due, i, c))
+        self._timer = loop.call_at(heap[0][0], self._pump)
+
+    async def _poll_batch(self, collectors: list[BaseCollector]) -> None:
+        async with asyncio.TaskGroup() as tg:
+            for collector in collectors:
+                tg.create_task(self._poll_once(collector))
+
+    def _spawn(self, coro) -> None:
+        """Run ``coro`` as a tracked task, cancelled on unmount."""
+        task = asyncio.create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
 
     def action_toggle_mini(self) -> None:
         """Toggle between mini (status bar only) and full dashboard."""
@@ -142,15 +202,20 @@ class DashboardApp(App):
         header.set_class(self._mini_mode, "hidden")
 
     def action_refresh(self) -> None:
-        for collector in self.collectors:
-            asyncio.create_task(self._poll_once(collector))
+        self._spawn(self._poll_batch(self.collectors))
 
     async def _poll_once(self, collector: BaseCollector) -> None:
-        card = self._cards[collector.name]
-        result = await collector.collect()
-        card.result = result
-        self._update_status_bar()
-
-    def on_unmount(self) -> None:
-        for task in self._tasks:
+        result = await collector.get_cached(max_age=0)
+        # The first result of a frame arms a one-shot flush; later ones in
+        # the same frame just join the batch, and an idle app never wakes
+        if not self._pending:
+            self.set_timer(1 / 30, self._flush_pending)
+        self._pending[collector.name] = result
+
+    async def on_unmount(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        for task in self._inflight:
             task.cancel()
+        for collector in self.collectors:
+            await collector.aclose()
@@ -2,30 +2,35 @@
 
 from __future__ import annotations
 
+import functools
+
 SPARKLINE_CHARS = "\u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
 
 # Supported color names
-VALID_COLORS = {"red", "green", "yellow", "cyan", "magenta", "blue", "white"}
+VALID_COLORS = frozenset({"red", "green", "yellow", "cyan", "magenta", "blue", "white"})
+
+
+# Highest index into SPARKLINE_CHARS
+_SPARK_TOP = len(SPARKLINE_CHARS) - 1
 
 
 def sparkline(values: list[float | int]) -> str:
     """Render a mini sparkline from recent values."""
     if not values:
         return ""
-    nums = [float(v) for v in values[-20:]]
+    nums = values[-20:]
     lo = min(nums)
     hi = max(nums)
     span = hi - lo if hi != lo else 1.0
-    return "".join(
-        SPARKLINE_CHARS[min(int((v - lo) / span * (len(SPARKLINE_CHARS) - 1)), len(SPARKLINE_CHARS) - 1)]
-        for v in nums
-    )
+    # (v - lo) / span is at most 1.0, so the index never exceeds _SPARK_TOP
+    chars = SPARKLINE_CHARS
+    return "".join([chars[int((v - lo) / span * _SPARK_TOP)] for v in nums])
 
 
 def compute_color(metric: dict) -> str:
     """Determine display color from explicit color or warn thresholds."""
     explicit = metric.get("color")
-    if explicit and explicit in VALID_COLORS:
+    if explicit in VALID_COLORS:
         return explicit
 
     value = metric.get("value")
@@ -39,15 +44,26 @@ def compute_color(metric: dict) -> str:
     return "green"
 
 
+# Bound once at import; cheaper per call than an f-string format spec
+_FORMAT_FLOAT = float.__format__
+_FORMAT_INT = int.__format__
+
+
 def format_value(value) -> str:
     """Format a metric value for display."""
     if isinstance(value, float):
-        return f"{value:,.1f}"
+        return _FORMAT_FLOAT(value, ",.1f")
     if isinstance(value, int):
-        return f"{value:,}"
+        return _FORMAT_INT(value, ",")
     return str(value)
 
 
+@functools.lru_cache(maxsize=256)
+def _pad_label(label) -> str:
+    """Label padded to the row's label column; labels repeat every poll."""
+    return str(label).ljust(18)
+
+
 def render_metric_row(metric: dict) -> str:
     """Render one metric as a Rich-markup string for use inside a ServerCard.
 
@@ -58,10 +74,10 @@ def render_metric_row(metric: dict) -> str:
     value = metric.get("value", "")
     unit = metric.get("unit", "")
     color = compute_color(metric)
-    spark_values = metric.get("sparkline_history", [])
+    spark_values = metric.get("sparkline_history", ())
 
     display = format_value(value)
     unit_str = f" {unit}" if unit else ""
     spark_str = f" [dim]{sparkline(spark_values)}[/]" if spark_values else ""
 
-    return f"  [dim]{label:<18}[/] [{color}]{display}{unit_str}[/]{spark_str}"
+    return f"  [dim]{_pad_label(label)}[/] [{color}]{display}{unit_str}[/]{spark_str}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from rich.markup import escape
 
+from textual.content import Content
 from textual.reactive import reactive
 from textual.widgets import Static
 
@@ -23,41 +24,72 @@ class ServerCard(Static):
         super().__init__(**kwargs)
         self.server_name = server_name
         self.server_url = url
-
-    def render(self) -> str:
-        r = self.result
-        parts: list[str] = []
-
+        # Name and URL never change, so their markup is built once
+        self._url_line = f"\n  [dim]{escape(url)}[/]" if url else ""
+        self._waiting = f"[bold cyan]{server_name}[/]  [dim]waiting...[/]{self._url_line}"
+        self._header_ok = f"[bold green]\u25cf[/] [bold]{server_name}[/]"
+        self._header_error = f"[bold red]\u25cf[/] [bold]{server_name}[/]"
+        # Rendered metric lines keyed by every field that affects them
+        self._row_cache: dict[tuple, str] = {}
+        # Markup for the current result and its parsed form; both are
+        # rebuilt only when result changes, so repaints never re-parse markup
+        self._rendered: str = self._render_result(None)
+        self._parsed = Content.from_markup(self._rendered)
+
+    def render(self) -> Content:
+        return self._parsed
+
+    def _render_result(self, r: dict | None) -> str:
         if r is None:
-            parts.append(f"[bold cyan]{self.server_name}[/]  [dim]waiting...[/]")
-            if self.server_url:
-                parts.append(f"  [dim]{escape(self.server_url)}[/]")
-            return "\n".join(parts)
+            return self._waiting
 
         error = r.get("error")
-        metrics = r.get("metrics", [])
+        metrics = r.get("metrics", ())
 
         if error and not metrics:
-            parts.append(f"[bold red]\u25cf[/] [bold]{self.server_name}[/]  [red]{error}[/]")
-            if self.server_url:
-                parts.append(f"  [dim]{escape(self.server_url)}[/]")
-            return "\n".join(parts)
+            return f"{self._header_error}  [red]{error}[/]{self._url_line}"
 
         # Header
-        parts.append(f"[bold green]\u25cf[/] [bold]{self.server_name}[/]")
-        if self.server_url:
-            parts.append(f"  [dim]{escape(self.server_url)}[/]")
-
+        header = self._header_ok
         if error:
-            parts[0] += f"  [yellow]{error}[/]"
+            header += f"  [yellow]{error}[/]"
+        parts = [header + self._url_line]
 
         # Metric rows
         for m in metrics:
-            parts.append(render_metric_row(m))
+            parts.append(self._metric_row(m))
 
         return "\n".join(parts)
 
+    def _metric_row(self, m: dict) -> str:
+        """``render_metric_row`` memoized per card for unchanged metrics."""
+        value = m.get("value", "")
+        spark = m.get("sparkline_history")
+        key = (
+            m.get("label"), m.get("key"), type(value), value, m.get("unit"),
+            m.get("color"), m.get("warn_above"), m.get("warn_below"),
+            tuple(spark[-20:]) if spark else None,
+        )
+        try:
+            row = self._row_cache.get(key)
+        except TypeError:  # unhashable value, e.g. a list
+            return render_metric_row(m)
+        if row is None:
+            if len(self._row_cache) >= 256:
+                self._row_cache.clear()
+            row = self._row_cache[key] = render_metric_row(m)
+        return row
+
     def watch_result(self, new_val: dict | None) -> None:
         has_error = bool(new_val and new_val.get("error"))
         self.set_class(has_error, "error-state")
-        self.refresh(layout=True)
+
+        # Skip the repaint when the new result renders identically, and
+        # only ask for a relayout when the number of lines changed
+        rendered = self._render_result(new_val)
+        if rendered == self._rendered:
+            return
+        relayout = rendered.count("\n") != self._rendered.count("\n")
+        self._rendered = rendered
+        self._parsed = Content.from_markup(rendered)
+        self.refresh(layout=relayout)
@@ -10,17 +10,39 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
+import heapq
+import os
 import socket
+import stat
 import sys
 import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import orjson
 import yaml
 import uvicorn
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+try:
+    import httptools
+except ImportError:  # uvicorn installed without [standard]
+    httptools = None
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 
 from collectors import HttpCollector, RedisCollector, PostgresCollector
 from collectors.base import BaseCollector
@@ -31,19 +53,54 @@ from collectors.postgres_collector import CustomQuery
 # Config loader (mirrors monitor.py — imports avoided to dodge Textual dep)
 # ---------------------------------------------------------------------------
 
+def _read_config(path: Path) -> dict:
+    """Parse a YAML config, going through a ``<name>.cache.json`` sidecar.
+
+    The sidecar is keyed by the YAML's mtime and sha256, so an unchanged
+    config is loaded with orjson instead of PyYAML. Its layout is shared
+    with monitor.py, which checks only the mtime.
+    """
+    data = path.read_bytes()
+    mtime = os.path.getmtime(path)
+    digest = hashlib.sha256(data).hexdigest()
+    cache = path.with_name(path.name + ".cache.json")
+    try:
+        cached = orjson.loads(cache.read_bytes())
+        if cached.get("mtime") == mtime and cached.get("sha256") == digest:
+            return cached["config"]
+    except (OSError, orjson.JSONDecodeError, AttributeError, KeyError):
+        pass
+
+    config = yaml.load(data, Loader=_Loader)
+
+    # Written atomically so a concurrent reader never sees a partial file, and
+    # with the YAML's mode since it holds the same DSNs; a read-only config
+    # dir or non-JSON YAML just skips the cache
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                     stat.S_IMODE(os.stat(path).st_mode))
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps({"mtime": mtime, "sha256": digest, "config": config}))
+        os.replace(tmp, cache)
+    except (OSError, TypeError):
+        tmp.unlink(missing_ok=True)
+    return config
+
+
 def load_config(path: Path) -> list[BaseCollector]:
     """Parse servers.yaml and return a list of collectors."""
-    with open(path) as f:
-        config = yaml.safe_load(f)
+    config = _read_config(path)
 
     collectors: list[BaseCollector] = []
     for srv in config.get("servers", []):
+        g = srv.get  # bound once; several lookups per server
         name = srv["name"]
-        stype = srv.get("type", "http")
-        poll = srv.get("poll_every", 5)
+        stype = g("type", "http")
+        poll = g("poll_every", 5)
 
-        if srv.get("web_url"):
-            _web_urls[name] = srv["web_url"]
+        if web_url := g("web_url"):
+            _web_urls[name] = web_url
 
         if stype == "http":
             collectors.append(
@@ -57,9 +114,9 @@ def load_config(path: Path) -> list[BaseCollector]:
             collectors.append(
                 RedisCollector(
                     name=name,
-                    host=srv.get("host", "localhost"),
-                    port=srv.get("port", 6379),
-                    url=srv.get("url"),
+                    host=g("host", "localhost"),
+                    port=g("port", 6379),
+                    url=g("url"),
                     poll_every=poll,
                 )
             )
@@ -73,15 +130,25 @@ def load_config(path: Path) -> list[BaseCollector]:
                     warn_below=q.get("warn_below"),
                     poll_every=q.get("poll_every", poll),
                 )
-                for q in srv.get("queries", [])
+                for q in g("queries", [])
             ]
+            pool_min = g("pool_min_size", 1)
+            pool_max = g("pool_max_size", 4)
+            if pool_min > pool_max:
+                print(
+                    f"Warning: pool_min_size {pool_min} exceeds pool_max_size {pool_max} "
+                    f"for '{name}', using {pool_max}"
+                )
+                pool_min = pool_max
             collectors.append(
                 PostgresCollector(
                     name=name,
                     dsn=srv["dsn"],
                     poll_every=poll,
-                    system_stats=srv.get("system_stats", True),
+                    system_stats=g("system_stats", True),
                     queries=queries,
+                    pool_min_size=pool_min,
+                    pool_max_size=pool_max,
                 )
             )
         else:
@@ -94,13 +161,51 @@ def load_config(path: Path) -> list[BaseCollector]:
 # Shared state — latest snapshot per server
 # ---------------------------------------------------------------------------
 
-_state: dict[str, dict] = {}
+@dataclass(slots=True)
+class Snapshot:
+    """Latest state of one server, as served by /api/status."""
+
+    name: str
+    url: str
+    web_url: str | None
+    poll_every: float
+    last_updated: float = 0.0
+    metrics: list = field(default_factory=list)
+    error: str | None = None
+    had_error: bool = False
+    error_count: int = 0  # consecutive failed polls; 0 once one succeeds
+
+
+_state: dict[str, Snapshot] = {}
 _collectors: list[BaseCollector] = []
 _web_urls: dict[str, str] = {}   # server name → web app URL
 _tasks: list[asyncio.Task] = []
-_start_time: float = time.time()
+_inflight: dict[str, asyncio.Task] = {}  # server name → running poll
+
+
+def _concurrency() -> int:
+    """Collect limit from ``MONITOR_CONCURRENCY``, at least 1 (0 would deadlock)."""
+    raw = os.environ.get("MONITOR_CONCURRENCY") or "16"
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        raise SystemExit(f"MONITOR_CONCURRENCY must be an integer, got {raw!r}") from None
+
+
+# Upper bound on collects in flight at once, so a burst of due servers
+# can't exhaust outbound sockets or database connections
+_poll_slots = asyncio.Semaphore(_concurrency())
+_start_time: float = time.monotonic()  # for uptime; immune to wall-clock steps
 _total_polls: int = 0
 _ever_failed: set[str] = set()   # servers that have failed at least once
+# Last exception per server as ((type, args), message), so a collector
+# that keeps raising the same error doesn't re-format it every poll
+_last_exc: dict[str, tuple[tuple, str]] = {}
+_status_json: bytes | None = None  # /api/status body minus timestamp; None when stale
+# Running /metrics tallies, adjusted as each snapshot changes state
+_healthy_count: int = 0
+_errored_count: int = 0
+_warned_count: int = 0
 
 
 def _get_lan_ip() -> str:
@@ -115,32 +220,99 @@ def _get_lan_ip() -> str:
         return "127.0.0.1"
 
 
-_lan_ip: str = _get_lan_ip()
+_lan_ip: str | None = None  # resolved on first use; see _lan_ip_cached
+
+
+def _lan_ip_cached() -> str:
+    """LAN IP for /api/status, from ``MONITOR_LAN_IP`` or detected once."""
+    global _lan_ip
+    if _lan_ip is None:
+        _lan_ip = os.environ.get("MONITOR_LAN_IP") or _get_lan_ip()
+    return _lan_ip
+
+
+def _describe(name: str, exc: Exception) -> str:
+    """``str(exc)``, reused while a server keeps raising the same exception."""
+    key = (type(exc), exc.args)
+    last = _last_exc.get(name)
+    if last is not None and last[0] == key:
+        return last[1]
+    message = str(exc)
+    _last_exc[name] = (key, message)
+    return message
 
 
-async def _poll_loop(collector: BaseCollector) -> None:
-    """Background poll loop for a single collector."""
-    while True:
-        try:
+def _health(snap: Snapshot) -> tuple[bool, bool, bool]:
+    """Classify a snapshot as (healthy, errored, warned) for /metrics."""
+    error = snap.error
+    return (bool(snap.metrics) and not error, bool(error), snap.had_error and not error)
+
+
+async def _poll_once(collector: BaseCollector) -> None:
+    """Collect one server and fold the result into its snapshot."""
+    global _total_polls, _status_json, _healthy_count, _errored_count, _warned_count
+    try:
+        async with _poll_slots:
             result = await collector.collect()
-        except Exception as exc:
-            result = {"metrics": [], "error": str(exc)}
-        global _total_polls
-        _total_polls += 1
-        error = result.get("error")
-        if error:
-            _ever_failed.add(collector.name)
-        _state[collector.name] = {
-            "name": collector.name,
-            "url": collector.url,
-            "web_url": _web_urls.get(collector.name),
-            "poll_every": collector.poll_every,
-            "last_updated": time.time(),
-            "metrics": result.get("metrics", []),
-            "error": error,
-            "had_error": collector.name in _ever_failed,
-        }
-        await asyncio.sleep(collector.poll_every)
+    except Exception as exc:
+        result = {"metrics": [], "error": _describe(collector.name, exc)}
+    _total_polls += 1
+    error = result.get("error")
+    if error:
+        _ever_failed.add(collector.name)
+    snap = _state.get(collector.name)
+    if snap is None:
+        # Created on the first report, then updated in place
+        snap = _state[collector.name] = Snapshot(
+            name=collector.name,
+            url=collector.url,
+            web_url=_web_urls.get(collector.name),
+            poll_every=collector.poll_every,
+        )
+    was = _health(snap)
+    snap.last_updated = time.time()
+    snap.metrics = result.get("metrics", [])
+    snap.error = error
+    snap.had_error = collector.name in _ever_failed
+    snap.error_count = snap.error_count + 1 if error else 0
+    _status_json = None
+
+    now = _health(snap)
+    if now != was:
+        _healthy_count += now[0] - was[0]
+        _errored_count += now[1] - was[1]
+        _warned_count += now[2] - was[2]
+
+
+async def _scheduler() -> None:
+    """Single poll scheduler for every collector, driven by a heap of due times."""
+    loop = asyncio.get_running_loop()
+    # Resolved once; the loop below runs for the life of the process
+    clock, sleep = loop.time, asyncio.sleep
+    heappop, heappush = heapq.heappop, heapq.heappush
+    start = clock()
+    # Spread first polls across each collector's interval so they don't
+    # all fire in the same tick, forever after
+    n = len(_collectors)
+    heap = [(start + i * c.poll_every / n, i, c) for i, c in enumerate(_collectors)]
+    heapq.heapify(heap)
+    while heap:
+        deadline, i, c = heap[0]
+        now = clock()
+        if deadline > now:
+            await sleep(deadline - now)
+            continue
+        heappop(heap)
+        # A collect still running from the last round keeps its slot
+        if c.name not in _inflight:
+            task = _inflight[c.name] = asyncio.create_task(_poll_once(c))
+            task.add_done_callback(lambda _, name=c.name: _inflight.pop(name, None))
+        # Fixed cadence regardless of collect latency; resync instead of
+        # bursting catch-up polls if we fell a whole interval behind
+        deadline += c.poll_every
+        if deadline <= now:
+            deadline = now + c.poll_every
+        heappush(heap, (deadline, i, c))
 
 
 # ---------------------------------------------------------------------------
@@ -149,85 +321,133 @@ async def _poll_loop(collector: BaseCollector) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Start collector tasks on startup, cancel on shutdown."""
-    for c in _collectors:
-        _tasks.append(asyncio.create_task(_poll_loop(c)))
+    """Start the poll scheduler on startup, cancel it on shutdown."""
+    _tasks.append(asyncio.create_task(_scheduler()))
     yield
-    for t in _tasks:
+    for t in (*_tasks, *_inflight.values()):
         t.cancel()
+    for c in _collectors:
+        await c.aclose()
 
 
 app = FastAPI(title="Server Monitor", lifespan=lifespan)
 
 
+def _json(content) -> Response:
+    """JSON response encoded with orjson instead of the stdlib encoder."""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
+class _StaticWithCachedIndex(StaticFiles):
+    """StaticFiles that serves index.html from memory with a fixed ETag.
+
+    The dashboard page is loaded far more often than it changes, so it is
+    read once at startup instead of being stat'ed and opened per request.
+    Edits to index.html take effect on restart.
+    """
+
+    def __init__(self, *, directory: Path, **kwargs) -> None:
+        super().__init__(directory=str(directory), **kwargs)
+        index = directory / "index.html"
+        self._index = index.read_bytes() if index.is_file() else None
+        if self._index is not None:
+            digest = hashlib.md5(self._index, usedforsecurity=False).hexdigest()
+            self._index_headers = {"ETag": f'"{digest}"', "Cache-Control": "public, max-age=60"}
+
+    async def get_response(self, path: str, scope) -> Response:
+        if self._index is None or path not in (".", "index.html") or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+        etag = self._index_headers["ETag"]
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=self._index_headers)
+        return Response(self._index, media_type="text/html", headers=self._index_headers)
+
+
 @app.get("/api/status")
 async def api_status():
     """Return latest snapshot of all monitored servers."""
-    servers = list(_state.values())
-    return JSONResponse({"servers": servers, "timestamp": time.time(), "lan_ip": _lan_ip})
+    global _status_json
+    # Snapshots only change when a poll lands, so the encoded servers list
+    # is reused across requests; only the timestamp is fresh per request.
+    # orjson encodes the Snapshot dataclasses natively
+    if _status_json is None:
+        _status_json = orjson.dumps({"servers": list(_state.values()), "lan_ip": _lan_ip_cached()})[:-1]
+    body = b"%s,\"timestamp\":%s}" % (_status_json, orjson.dumps(time.time()))
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/clear-warnings")
 async def clear_warnings():
     """Clear the sticky 'ever failed' state for all servers."""
+    global _status_json, _warned_count
     _ever_failed.clear()
     for snap in _state.values():
-        snap["had_error"] = False
-    return JSONResponse({"ok": True})
+        snap.had_error = False
+    _status_json = None
+    _warned_count = 0
+    return _json({"ok": True})
+
+
+# /metrics payload; only the values (and the warned color) change per request
+_METRICS_BODY: dict = {
+    "metrics": [
+        {
+            "key": "servers_monitored",
+            "label": "Servers Monitored",
+            "value": 0,
+            "unit": "count",
+        },
+        {
+            "key": "servers_healthy",
+            "label": "Servers Healthy",
+            "value": 0,
+            "unit": "count",
+            "color": "green",
+        },
+        {
+            "key": "servers_errored",
+            "label": "Servers Errored",
+            "value": 0,
+            "unit": "count",
+            "warn_above": 0,
+        },
+        {
+            "key": "servers_warned",
+            "label": "Servers Warned",
+            "value": 0,
+            "unit": "count",
+            "color": "green",
+        },
+        {
+            "key": "uptime",
+            "label": "Uptime",
+            "value": 0,
+            "unit": "s",
+        },
+        {
+            "key": "total_polls",
+            "label": "Total Polls",
+            "value": 0,
+            "unit": "count",
+        },
+    ]
+}
 
 
 @app.get("/metrics")
 async def metrics():
     """Self-monitoring endpoint — METRICS_SPEC.md format."""
-    servers = list(_state.values())
-    healthy = sum(1 for s in servers if s.get("metrics") and not s.get("error"))
-    errored = sum(1 for s in servers if s.get("error"))
-    warned = sum(1 for s in servers if s.get("had_error") and not s.get("error"))
-    uptime = int(time.time() - _start_time)
-
-    return JSONResponse({
-        "metrics": [
-            {
-                "key": "servers_monitored",
-                "label": "Servers Monitored",
-                "value": len(_collectors),
-                "unit": "count",
-            },
-            {
-                "key": "servers_healthy",
-                "label": "Servers Healthy",
-                "value": healthy,
-                "unit": "count",
-                "color": "green",
-            },
-            {
-                "key": "servers_errored",
-                "label": "Servers Errored",
-                "value": errored,
-                "unit": "count",
-                "warn_above": 0,
-            },
-            {
-                "key": "servers_warned",
-                "label": "Servers Warned",
-                "value": warned,
-                "unit": "count",
-                "color": "yellow" if warned > 0 else "green",
-            },
-            {
-                "key": "uptime",
-                "label": "Uptime",
-                "value": uptime,
-                "unit": "s",
-            },
-            {
-                "key": "total_polls",
-                "label": "Total Polls",
-                "value": _total_polls,
-                "unit": "count",
-            },
-        ]
-    })
+    monitored, healthy, errored, warned, uptime, polls = _METRICS_BODY["metrics"]
+    monitored["value"] = len(_collectors)
+    healthy["value"] = _healthy_count
+    errored["value"] = _errored_count
+    warned["value"] = _warned_count
+    warned["color"] = "yellow" if _warned_count > 0 else "green"
+    uptime["value"] = int(time.monotonic() - _start_time)
+    polls["value"] = _total_polls
+    # Filled and encoded without an await in between, so requests can't interleave
+    return _json(_METRICS_BODY)
 
 
 # Mount advice app sub-application if available
@@ -241,7 +461,7 @@ except ImportError:
 # Serve static files (index.html) at root
 static_dir = Path(__file__).parent / "static"
 static_dir.mkdir(exist_ok=True)
-app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+app.mount("/", _StaticWithCachedIndex(directory=static_dir, html=True), name="static")
 
 
 # ---------------------------------------------------------------------------
@@ -271,7 +491,14 @@ def main() -> None:
         sys.exit(1)
 
     print(f"Starting web dashboard on http://{args.host}:{args.port}")
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level="info",
+        loop="uvloop" if uvloop else "asyncio",
+        http="httptools" if httptools else "h11",
+    )
 
 
 if __name__ == "__main__":